@@ -4,11 +4,11 @@ ISO 3166-3 Web Scraper - Professional Clean Output Only
 Scrapes ISO 3166-3 data from Wikipedia and produces a single clean JSON file.
 
 Requirements:
-- pandas
 - requests
-- beautifulsoup4
+- lxml
+- orjson (optional, faster JSON output)
 
-Install: pip install pandas requests beautifulsoup4
+Install: pip install requests lxml orjson
 
 Usage:
     python scrape_iso_3166_3.py
@@ -17,260 +17,423 @@ Output:
     iso_3166_3_cleaned.json - Clean, standardized data
 """
 
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import lxml.html
 import json
 import re
+import os
+import functools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib json encoder
+    orjson = None
 
-class ISO3166_3Scraper:
-    """Scraper that produces clean, standardized JSON output directly from Wikipedia."""
+
+# Precompiled patterns used by the record parsers
+_RE_WS = re.compile(r'\s+')
+_RE_CELL_WS = re.compile(r'[\r\n]+|\s{2,}')
+_RE_NOTE = re.compile(r'\[note \d+\]')
+_RE_ALPHA2 = re.compile(r'^[A-Z]{2}$')
+_RE_ALPHA3 = re.compile(r'^[A-Z]{3}$')
+_RE_NUM3 = re.compile(r'^\d{3}$')
+_RE_HAS_CODE = re.compile(r'[A-Z]{2}')
+_RE_YEAR_RANGE = re.compile(r'(\d{4})[–\-](\d{4})')
+# Successor name (everything since the previous code triple, so nested parentheses
+# like "Sint Maarten (Dutch part)" survive) followed by its (XX, XXX, NNN) codes
+_RE_SUCC = re.compile(
+    r'(?P<name>.*?)\((?P<alpha2>[A-Z]{2}),\s*(?P<alpha3>[A-Z]{2,3}),\s*(?P<numeric>\d{3,4})\)',
+    re.DOTALL
+)
+_RE_ACTION_PREFIX = re.compile(r'^(?:Merged into |Name changed to |Divided into:?\s*|Split into )')
+_RE_PREFIX_DIV = re.compile(r'^(?:Divided into:|Split into:)\s*', re.IGNORECASE)
+_RE_TRAILING_CODES = re.compile(r'\s*\([A-Z]{2}.*?\)')
+
+# Tables larger than this are processed across worker processes on multi-core
+# machines. The value comes from the original request and has not been tuned;
+# on one core the pool was slower than the plain loop at every size up to 50k rows
+_PARALLEL_MIN_ROWS = 500
+
+# Common incomplete name patterns
+_INCOMPLETE_NAME_PATTERNS = {
+    "Republic of": re.compile(r"([\w\s]+,?\s*Republic of)"),
+    "Democratic Republic of the": re.compile(r"([\w\s]+,?\s*Democratic Republic of the)"),
+}
+
+
+def _cell_text(cell) -> str:
+    """Cell text with line breaks and whitespace runs squeezed, as pd.read_html did."""
+    return _RE_CELL_WS.sub(' ', cell.text_content().strip())
+
+
+def _span(cell, attr: str) -> int:
+    """Read a rowspan/colspan attribute, defaulting to 1 on missing or bad values."""
+    try:
+        return max(int(cell.get(attr, 1)), 1)
+    except ValueError:
+        return 1
+
+
+# Record parsing lives at module level so worker processes only need the row dict
+
+@functools.lru_cache(maxsize=1024)
+def clean_country_name(name: str) -> str:
+    """Remove Wikipedia notes and action prefixes from country names (memoized)."""
+    if not name:
+        return ""
     
-    def __init__(self):
-        self.url = "https://en.wikipedia.org/wiki/ISO_3166-3"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
+    name = str(name)
     
-    def fetch_table(self) -> pd.DataFrame:
-        """Fetch and extract the ISO 3166-3 table from Wikipedia."""
-        print("Fetching data from Wikipedia...")
-        
-        try:
-            response = requests.get(self.url, headers=self.headers, timeout=15)
-            response.raise_for_status()
-        except requests.RequestException as e:
-            print(f"Error fetching Wikipedia page: {e}")
-            raise
-        
-        # Parse with BeautifulSoup
-        soup = BeautifulSoup(response.content, 'html.parser')
-        table = soup.find('table', {'class': 'sortable'})
-        
-        if not table:
-            # Fallback: use pandas read_html
-            tables = pd.read_html(response.content)
-            df = max(tables, key=lambda x: x.shape[0])
-        else:
-            df = pd.read_html(str(table))[0]
-        
-        print(f"✓ Fetched {len(df)} records")
-        return df
+    # Remove Wikipedia note references like [note 1]
+    name = _RE_NOTE.sub('', name)
     
-    def clean_country_name(self, name: str) -> str:
-        """Remove Wikipedia notes and action prefixes from country names."""
-        if not name or pd.isna(name):
-            return ""
-        
-        name = str(name)
-        
-        # Remove Wikipedia note references like [note 1]
-        name = re.sub(r'\[note \d+\]', '', name)
-        
-        # Remove action prefixes
-        prefixes = [
-            'Merged into ',
-            'Name changed to ',
-            'Divided into:',
-            'Divided into: ',
-            'Split into '
-        ]
-        
-        for prefix in prefixes:
-            if name.startswith(prefix):
-                name = name[len(prefix):]
-        
-        # Clean whitespace
-        return ' '.join(name.split()).strip()
+    # Remove action prefixes
+    name = _RE_ACTION_PREFIX.sub('', name, count=1)
     
-    def parse_former_codes(self, codes_str: str) -> Dict[str, Optional[str]]:
-        """Parse former codes string into structured format."""
-        result = {"alpha2": None, "alpha3": None, "numeric": None}
-        
-        if pd.isna(codes_str) or not codes_str:
-            return result
-        
-        codes_str = str(codes_str).strip()
-        parts = [p.strip() for p in codes_str.split(',')]
-        
-        for part in parts:
-            if re.match(r'^[A-Z]{2}$', part):
-                result['alpha2'] = part
-            elif re.match(r'^[A-Z]{3}$', part):
-                result['alpha3'] = part
-            elif re.match(r'^\d{3}$', part):
-                result['numeric'] = part
-        
+    # Clean whitespace
+    return _RE_WS.sub(' ', name).strip()
+
+
+def parse_former_codes(codes_str: str) -> Dict[str, Optional[str]]:
+    """Parse former codes string into structured format."""
+    result = {"alpha2": None, "alpha3": None, "numeric": None}
+    
+    if not codes_str:
         return result
     
-    def parse_validity_period(self, period_str: str) -> Dict[str, Optional[int]]:
-        """Parse validity period into start and end years as integers."""
-        result = {"start": None, "end": None}
-        
-        if pd.isna(period_str) or not period_str:
-            return result
-        
-        period_str = str(period_str).strip()
-        match = re.search(r'(\d{4})[–\-](\d{4})', period_str)
-        
-        if match:
-            result['start'] = int(match.group(1))
-            result['end'] = int(match.group(2))
-        
+    codes_str = str(codes_str).strip()
+    parts = [p.strip() for p in codes_str.split(',')]
+    
+    for part in parts:
+        if _RE_ALPHA2.match(part):
+            result['alpha2'] = part
+        elif _RE_ALPHA3.match(part):
+            result['alpha3'] = part
+        elif _RE_NUM3.match(part):
+            result['numeric'] = part
+    
+    return result
+
+
+def parse_validity_period(period_str: str) -> Dict[str, Optional[int]]:
+    """Parse validity period into start and end years as integers."""
+    result = {"start": None, "end": None}
+    
+    if not period_str:
         return result
     
-    def parse_successors(self, successor_str: str, raw_desc: str) -> List[Dict]:
-        """Parse successor countries from the description."""
-        successors = []
-        
-        if pd.isna(successor_str) or not successor_str:
-            return successors
+    period_str = str(period_str).strip()
+    match = _RE_YEAR_RANGE.search(period_str)
+    
+    if match:
+        result['start'] = int(match.group(1))
+        result['end'] = int(match.group(2))
+    
+    return result
+
+
+def parse_successors(successor_str: str, raw_desc: str) -> List[Dict]:
+    """Parse successor countries from the description."""
+    successors = []
+    
+    if not successor_str:
+        return successors
+    
+    successor_str = str(successor_str)
+    
+    # Single pass: each match carries the country name preceding its codes
+    for match in _RE_SUCC.finditer(successor_str):
+        country_name_raw = match.group('name').strip()
         
-        successor_str = str(successor_str)
+        # Remove any leading separators or keywords
+        country_name_raw = _RE_PREFIX_DIV.sub('', country_name_raw)
         
-        # More robust pattern that handles nested parentheses like "Sint Maarten (Dutch part)"
-        # Strategy: find all code patterns (XX, XXX, NNN) and work backwards to find the country name
+        # Remove any [note X] references
+        country_name_raw = _RE_NOTE.sub('', country_name_raw)
         
-        # First, find all code patterns
-        code_pattern = r'\(([A-Z]{2}),\s*([A-Z]{2,3}),\s*(\d{3,4})\)'
-        code_matches = list(re.finditer(code_pattern, successor_str))
+        # Clean up the country name
+        country_name = clean_country_name(country_name_raw.strip())
         
-        if not code_matches:
-            return successors
+        # Skip if the "name" is actually just separator text or too short
+        if not country_name or len(country_name) < 3:
+            continue
         
-        for i, code_match in enumerate(code_matches):
-            # Get the end position of the previous match (or start of string)
-            start_pos = code_matches[i-1].end() if i > 0 else 0
-            end_pos = code_match.start()
-            
-            # Extract the country name between start_pos and the current code
-            country_name_raw = successor_str[start_pos:end_pos].strip()
-            
-            # Remove any leading separators or keywords
-            country_name_raw = re.sub(r'^(?:Divided into:|Split into:)\s*', '', country_name_raw, flags=re.IGNORECASE)
-            
-            # Remove any [note X] references
-            country_name_raw = re.sub(r'\[note \d+\]', '', country_name_raw)
-            
-            # Clean up the country name
-            country_name = self.clean_country_name(country_name_raw.strip())
-            
-            # Skip if the "name" is actually just separator text or too short
-            if not country_name or len(country_name) < 3:
-                continue
-            
-            # Fix incomplete country names
-            country_name = self.fix_incomplete_name(country_name, raw_desc)
-            
-            successors.append({
-                "name": country_name,
-                "alpha2": code_match.group(1),
-                "alpha3": code_match.group(2),
-                "numeric": code_match.group(3)
-            })
+        # Fix incomplete country names
+        country_name = fix_incomplete_name(country_name, raw_desc)
         
-        return successors
+        successors.append({
+            "name": country_name,
+            "alpha2": match.group('alpha2'),
+            "alpha3": match.group('alpha3'),
+            "numeric": match.group('numeric')
+        })
     
-    def fix_incomplete_name(self, name: str, raw_description: str) -> str:
-        """Fix incomplete country names by checking raw description."""
-        if not name or len(name) > 25:
-            return name
-        
-        # Common incomplete patterns
-        patterns = {
-            "Republic of": r"([\w\s]+,?\s*Republic of)",
-            "Democratic Republic of the": r"([\w\s]+,?\s*Democratic Republic of the)",
-        }
-        
-        for incomplete, pattern in patterns.items():
-            if name == incomplete or name.endswith(incomplete):
-                match = re.search(pattern, raw_description)
-                if match:
-                    full_name = match.group(1)
-                    # Remove any trailing codes in parentheses
-                    full_name = re.sub(r'\s*\([A-Z]{2}.*?\)', '', full_name)
-                    return full_name.strip()
-        
+    return successors
+
+
+@functools.lru_cache(maxsize=1024)
+def fix_incomplete_name(name: str, raw_description: str) -> str:
+    """Fix incomplete country names by checking raw description (memoized)."""
+    if not name or len(name) > 25:
         return name
     
-    def determine_transition_type(self, successor_str: str) -> str:
-        """Determine the type of transition based on the description."""
-        if pd.isna(successor_str) or not successor_str:
-            return "other"
-        
-        desc_lower = str(successor_str).lower()
-        
-        if "merged into" in desc_lower:
-            return "merged"
-        elif "name changed" in desc_lower:
-            return "name_changed"
-        elif "divided into" in desc_lower or "split into" in desc_lower:
-            return "divided"
-        else:
-            return "other"
+    for incomplete, pattern in _INCOMPLETE_NAME_PATTERNS.items():
+        if name == incomplete or name.endswith(incomplete):
+            match = pattern.search(raw_description)
+            if match:
+                full_name = match.group(1)
+                # Remove any trailing codes in parentheses
+                full_name = _RE_TRAILING_CODES.sub('', full_name)
+                return full_name.strip()
     
-    def process_record(self, row: pd.Series) -> Dict:
-        """Process a single record into clean format."""
-        # Parse former codes
-        former_codes = self.parse_former_codes(row.get('Former codes', ''))
-        
-        # Parse validity period
-        validity = self.parse_validity_period(row.get('Period of validity', ''))
-        
-        # Get raw description
-        raw_desc = str(row.get('New country names and codes', ''))
-        
-        # Parse successors
-        successors = self.parse_successors(raw_desc, raw_desc)
-        
-        # Determine transition type
-        transition_type = self.determine_transition_type(raw_desc)
+    return name
+
+
+def determine_transition_type(successor_str: str) -> str:
+    """Determine the type of transition based on the description."""
+    if not successor_str:
+        return "other"
+    
+    desc_lower = str(successor_str).lower()
+    
+    if "merged into" in desc_lower:
+        return "merged"
+    elif "name changed" in desc_lower:
+        return "name_changed"
+    elif "divided into" in desc_lower or "split into" in desc_lower:
+        return "divided"
+    else:
+        return "other"
+
+
+def process_record(row: Dict[str, str]) -> Dict:
+    """Process a single record into clean format."""
+    # Parse former codes
+    former_codes = parse_former_codes(row.get('Former codes', ''))
+    
+    # Parse validity period
+    validity = parse_validity_period(row.get('Period of validity', ''))
+    
+    # Get raw description
+    raw_desc = row.get('New country names and codes', '')
+    
+    # Parse successors
+    successors = parse_successors(raw_desc, raw_desc)
+    
+    # Determine transition type
+    transition_type = determine_transition_type(raw_desc)
+    
+    # Clean former country name
+    former_name = clean_country_name(row.get('Former country name', ''))
+    
+    # Get ISO 3166-3 code
+    iso_3166_3_code = row.get('ISO 3166-3 code', '').strip() or None
+    
+    # Build the clean record
+    record = {
+        "former_country": {
+            "name": former_name,
+            "alpha2": former_codes['alpha2'],
+            "alpha3": former_codes['alpha3'],
+            "numeric": former_codes['numeric'],
+            "iso_3166_3_alpha4": iso_3166_3_code
+        },
+        "validity_period": validity,
+        "transition": {
+            "type": transition_type,
+            "successors": successors
+        }
+    }
+    
+    return record
+
+
+def _process_row(row: Dict[str, str]) -> Tuple[Optional[Dict], Optional[str]]:
+    """Worker entry point: process a single record, returning (record, error message)."""
+    try:
+        return process_record(row), None
+    except Exception as e:
+        return None, str(e)
+
+
+class ISO3166_3Scraper:
+    """Scraper that produces clean, standardized JSON output directly from Wikipedia."""
+    
+    def __init__(self, cache_dir: str = '.iso3166_cache'):
+        self.url = "https://en.wikipedia.org/wiki/ISO_3166-3"
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept': 'text/html'
+        }
         
-        # Clean former country name
-        former_name = self.clean_country_name(row.get('Former country name', ''))
+        # Reuse one pooled session across fetches (keep-alive, retries on redirects/errors)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
+        
+        # On-disk copy of the last fetched page, revalidated with ETag/Last-Modified;
+        # relative to the working directory, like save_json's output_file
+        self.cache_dir = Path(cache_dir)
+    
+    def fetch_html(self) -> str:
+        """Fetch the Wikipedia page, reusing the cached copy if it is unchanged."""
+        page_file = self.cache_dir / 'page.html'
+        meta_file = self.cache_dir / 'page_meta.json'
+        
+        # Send conditional headers when a cached copy exists
+        conditional = {}
+        if page_file.exists() and meta_file.exists():
+            try:
+                meta = json.loads(meta_file.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                meta = {}
+            if meta.get('etag'):
+                conditional['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                conditional['If-Modified-Since'] = meta['last_modified']
+        
+        response = self.session.get(self.url, headers=conditional, timeout=15)
+        response.raise_for_status()
+        
+        if response.status_code == 304:
+            print("✓ Page unchanged since last fetch, using cached copy")
+            return page_file.read_text(encoding='utf-8')
+        
+        # Decode here instead of in lxml, which falls back to Latin-1 when the
+        # page has no <meta charset>; sniff the body if the header has no charset
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = response.apparent_encoding
+        html = response.text
+        
+        # Store the fresh copy; a failed cache write should not fail the scrape
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            page_file.write_text(html, encoding='utf-8')
+            meta_file.write_text(json.dumps({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }), encoding='utf-8')
+        except OSError as e:
+            print(f"⚠ Could not write page cache: {e}")
+        
+        return html
+    
+    def fetch_rows(self) -> List[Dict[str, str]]:
+        """Fetch the ISO 3166-3 table from Wikipedia as a list of header-keyed rows."""
+        print("Fetching data from Wikipedia...")
         
-        # Get ISO 3166-3 code
-        iso_3166_3_code = str(row.get('ISO 3166-3 code', '')).strip()
-        if iso_3166_3_code == 'nan':
-            iso_3166_3_code = None
+        try:
+            html = self.fetch_html()
+        except requests.RequestException as e:
+            print(f"Error fetching Wikipedia page: {e}")
+            raise
         
-        # Build the clean record
-        record = {
-            "former_country": {
-                "name": former_name,
-                "alpha2": former_codes['alpha2'],
-                "alpha3": former_codes['alpha3'],
-                "numeric": former_codes['numeric'],
-                "iso_3166_3_alpha4": iso_3166_3_code
-            },
-            "validity_period": validity,
-            "transition": {
-                "type": transition_type,
-                "successors": successors
-            }
-        }
+        # Parse with lxml (C parser) and locate the table by its "Former codes"
+        # header, which is more stable than Wikipedia's styling classes
+        root = lxml.html.fromstring(html)
+        tables = root.xpath("//table[.//tr/th[contains(normalize-space(), 'Former codes')]]")
+        
+        if not tables:
+            # Fallback: first sortable table
+            tables = root.xpath(
+                "//table[contains(concat(' ', normalize-space(@class), ' '), ' sortable ')]"
+            )
+        if not tables:
+            raise ValueError("ISO 3166-3 table not found on the Wikipedia page")
+        table = tables[0]
+        
+        # Drop hidden sort keys and inline styles, and keep <br> as a line break
+        # (pd.read_html's displayed_only and <br> handling)
+        for elem in table.xpath('.//style'):
+            elem.drop_tree()
+        for elem in table.xpath('.//*[@style]'):
+            if 'display:none' in elem.get('style', '').replace(' ', ''):
+                elem.drop_tree()
+        for br in table.xpath('.//br'):
+            br.tail = '\n' + (br.tail or '')
+        
+        # Read cells straight off the lxml tree, no DataFrame in between
+        headers = [_cell_text(th) for th in table.xpath('(.//tr[th])[1]/th')]
+        
+        rows = []
+        remainder = []  # (column, text, rows still spanned) carried from rowspan cells
+        for tr in table.xpath('.//tr[td]'):
+            values = []
+            next_remainder = []
+            for cell in tr.xpath('./td|./th'):
+                # Fill in carried cells that sit before this one
+                while remainder and remainder[0][0] <= len(values):
+                    col, text, left = remainder.pop(0)
+                    values.append(text)
+                    if left > 1:
+                        next_remainder.append((col, text, left - 1))
+                
+                text = _cell_text(cell)
+                rowspan = _span(cell, 'rowspan')
+                for _ in range(_span(cell, 'colspan')):
+                    if rowspan > 1:
+                        next_remainder.append((len(values), text, rowspan - 1))
+                    values.append(text)
+            
+            # Carried cells after this row's last cell are used up here too,
+            # so a short row cannot leak them into the next one
+            for col, text, left in remainder:
+                values.append(text)
+                if left > 1:
+                    next_remainder.append((col, text, left - 1))
+            remainder = next_remainder
+            
+            rows.append(dict(zip(headers, values)))
         
-        return record
+        print(f"✓ Fetched {len(rows)} records")
+        return rows
     
     def scrape_and_clean(self) -> Dict:
         """Main method: scrape Wikipedia and return clean data."""
         # Fetch the table
-        df = self.fetch_table()
+        rows = self.fetch_rows()
+        
+        # Drop rows without any former code up front (e.g. unrelated rows added to the table),
+        # keeping each row's table position for error messages
+        indexed = [
+            (idx, row) for idx, row in enumerate(rows)
+            if _RE_HAS_CODE.search(row.get('Former codes', ''))
+        ]
+        if len(indexed) < len(rows):
+            print(f"⚠ Skipped {len(rows) - len(indexed)} rows without former codes")
+        indices = [idx for idx, _ in indexed]
+        rows = [row for _, row in indexed]
         
         # Process all records
         print("Processing and cleaning data...")
         clean_records = []
         errors = []
         
-        for idx, row in df.iterrows():
-            try:
-                record = self.process_record(row)
+        cpu_count = os.cpu_count() or 1
+        if cpu_count > 1 and len(rows) > _PARALLEL_MIN_ROWS:
+            # Regex-heavy and independent per row, so spread it across processes
+            chunksize = max(1, len(rows) // (4 * cpu_count))
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_process_row, rows, chunksize=chunksize))
+        else:
+            results = map(_process_row, rows)
+        
+        for idx, (record, error) in zip(indices, results):
+            if error is None:
                 clean_records.append(record)
-            except Exception as e:
-                errors.append(f"Row {idx}: {str(e)}")
+            else:
+                errors.append(f"Row {idx}: {error}")
         
         if errors:
             print(f"⚠ Encountered {len(errors)} errors during processing:")
@@ -278,15 +441,16 @@ class ISO3166_3Scraper:
                 print(f"  - {error}")
         
         # Build the final dataset
+        now = datetime.now()
         dataset = {
             "metadata": {
                 "title": "ISO 3166-3: Formerly Used Country Codes",
                 "description": "Codes for country names which have been deleted from ISO 3166-1 since its first publication in 1974",
                 "source": self.url,
                 "standard": "ISO 3166-3",
-                "version": datetime.now().strftime("%Y-%m"),
+                "version": now.strftime("%Y-%m"),
                 "total_records": len(clean_records),
-                "last_updated": datetime.now().strftime("%Y-%m-%d")
+                "last_updated": now.strftime("%Y-%m-%d")
             },
             "countries": clean_records
         }
@@ -304,8 +468,12 @@ class ISO3166_3Scraper:
         try:
             data = self.scrape_and_clean()
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Serialize in memory and write the payload in a single call
+            if orjson is not None:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+            Path(output_file).write_bytes(payload)
             
             print(f"\n✓ Clean data saved to: {output_file}")
             
@@ -316,22 +484,17 @@ class ISO3166_3Scraper:
             print(f"Total countries: {data['metadata']['total_records']}")
             
             # Count transition types
-            transition_counts = {}
-            for country in data['countries']:
-                t_type = country['transition']['type']
-                transition_counts[t_type] = transition_counts.get(t_type, 0) + 1
+            transition_counts = Counter(
+                country['transition']['type'] for country in data['countries']
+            )
             
             print("\nTransition types:")
             for t_type, count in sorted(transition_counts.items()):
                 print(f"  {t_type}: {count}")
             
             # Count by decade
-            decade_counts = {}
-            for country in data['countries']:
-                start = country['validity_period']['start']
-                if start:
-                    decade = f"{str(start)[:3]}0s"
-                    decade_counts[decade] = decade_counts.get(decade, 0) + 1
+            starts = (country['validity_period']['start'] for country in data['countries'])
+            decade_counts = Counter(f"{str(start)[:3]}0s" for start in starts if start)
             
             print("\nBy decade (start year):")
             for decade, count in sorted(decade_counts.items()):